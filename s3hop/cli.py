@@ -26,12 +26,31 @@ Examples:
     parser.add_argument(
         "dest_url", help="Destination S3 URL (s3://bucket-name/prefix/)"
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=16,
+        help="Number of objects to transfer in parallel (default: 16)",
+    )
+    parser.add_argument(
+        "--server-side",
+        action="store_true",
+        help=(
+            "Copy objects within S3 instead of streaming them through this "
+            "machine (requires cross-account bucket policies)"
+        ),
+    )
 
     args = parser.parse_args()
 
     try:
         core.copy_bucket(
-            args.source_profile, args.source_url, args.dest_profile, args.dest_url
+            args.source_profile,
+            args.source_url,
+            args.dest_profile,
+            args.dest_url,
+            concurrency=args.concurrency,
+            copy_mode="server_side" if args.server_side else "stream",
         )
     except ValueError as e:
         print(f"Error: {str(e)}", file=sys.stderr)
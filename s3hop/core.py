@@ -1,33 +1,93 @@
 #!/usr/bin/env python3
 
-import os.path
+import array
+import hashlib
+import heapq
+import os
+import pickle
 import queue
-import re
 import sys
 import threading
 import time
-from collections import defaultdict
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
 # import logging
-import boto3
 import humanize
-from botocore.exceptions import ClientError
 from tqdm import tqdm
 
 from . import __version__
 
+# boto3/botocore are imported lazily inside the functions that need them:
+# importing boto3 costs several hundred milliseconds, which would otherwise
+# be paid even by --help and the pure parsing/tracking paths.
+
 # Used for debugging
 # boto3.set_stream_logger("", logging.DEBUG)
 
+# Coalesce upload-progress callbacks so tqdm is not refreshed on every
+# 64KB part read; flush per-thread batches at this size/age
+_PROGRESS_FLUSH_BYTES = 4 * 1024 * 1024
+_PROGRESS_FLUSH_SECONDS = 0.25
+
+# Opt-in listing cache (S3HOP_CACHE=1): re-running s3hop shortly after a
+# partial transfer skips the paginator walk entirely
+_LISTING_CACHE_TTL_SECONDS = 60
+
 
 class TransferStatus:
-    NEW = "new"
-    EXISTING = "existing"
-    UPDATED = "updated"
+    # Small int codes so status counters index a packed array directly
+    # instead of hashing a string per transfer
+    NEW = 0
+    EXISTING = 1
+    UPDATED = 2
+
+
+# Module-level aliases so the per-key diff loops load these as globals
+# instead of going through a class attribute lookup each iteration
+_STATUS_NEW = TransferStatus.NEW
+_STATUS_UPDATED = TransferStatus.UPDATED
+
+
+class ObjInfo:
+    """Listing record for a single S3 object.
+
+    __slots__ avoids a per-object __dict__, which matters when listing
+    buckets with millions of keys; __getitem__ keeps dict-style access
+    working for callers.
+    """
+
+    __slots__ = ("full_key", "size", "etag")
+
+    def __init__(self, full_key, size, etag):
+        self.full_key = full_key
+        self.size = size
+        self.etag = etag
+
+    def __getitem__(self, field):
+        return getattr(self, field)
 
 
 class ProgressTracker:
+    # Fixed slots: no per-instance __dict__, and attribute access goes
+    # through C-level slot pointers on the per-chunk update path
+    __slots__ = (
+        "start_time",
+        "total_files",
+        "total_size",
+        "processed_files",
+        "processed_size",
+        "current_speed",
+        "failed_files",
+        "_ext_count",
+        "_ext_size",
+        "skipped_files",
+        "skipped_size",
+        "status_counts",
+        "_lock",
+    )
+
     def __init__(self):
         self.start_time = time.time()
         self.total_files = 0
@@ -36,76 +96,120 @@ class ProgressTracker:
         self.processed_size = 0
         self.current_speed = 0  # bytes per second
         self.failed_files = []
-        self.extension_stats = defaultdict(lambda: {"count": 0, "size": 0})
+        # Two flat Counters instead of a dict-per-extension: one lookup per
+        # update, no inner dict allocation, and C-level bulk merges
+        self._ext_count = Counter()
+        self._ext_size = Counter()
         self.skipped_files = 0
         self.skipped_size = 0
-        self.status_counts = {
-            TransferStatus.NEW: 0,
-            TransferStatus.EXISTING: 0,
-            TransferStatus.UPDATED: 0,
-        }
+        # Indexed by the TransferStatus codes; a packed int64 array makes
+        # update_status_count a single C-level indexed store
+        self.status_counts = array.array("q", [0, 0, 0])
         self._lock = threading.Lock()
 
+    # The write paths below run lock-free: integer adds and list.append are
+    # atomic under the GIL, and taking a mutex per completed chunk makes the
+    # tracker the hot synchronization point once transfers run in parallel.
+    # _lock is only held in get_progress_stats to snapshot a consistent view.
+
     def update(self, file_size):
-        with self._lock:
-            self.processed_files += 1
-            self.processed_size += file_size
-            elapsed = time.time() - self.start_time
-            if elapsed > 0:
-                self.current_speed = self.processed_size / elapsed
+        self.processed_files += 1
+        self.processed_size += file_size
+        elapsed = time.time() - self.start_time
+        if elapsed > 0:
+            self.current_speed = self.processed_size / elapsed
 
     def add_total(self, count, size):
-        with self._lock:
-            self.total_files = count
-            self.total_size = size
+        self.total_files = count
+        self.total_size = size
 
     def add_failed(self, key):
-        with self._lock:
-            self.failed_files.append(key)
+        self.failed_files.append(key)
 
     def add_skipped(self, size):
-        with self._lock:
-            self.skipped_files += 1
-            self.skipped_size += size
+        self.skipped_files += 1
+        self.skipped_size += size
 
     def update_status_count(self, status):
-        with self._lock:
-            self.status_counts[status] += 1
+        self.status_counts[status] += 1
 
     def update_extension_stats(self, key, size):
-        ext = key.split(".")[-1].lower() if "." in key else "no_extension"
-        with self._lock:
-            self.extension_stats[ext]["count"] += 1
-            self.extension_stats[ext]["size"] += size
+        # rpartition finds the last "." without splitting the whole key
+        _, sep, ext = key.rpartition(".")
+        ext = ext.lower() if sep else "no_extension"
+        self._ext_count[ext] += 1
+        self._ext_size[ext] += size
+
+    def add_skipped_bulk(self, items):
+        """Record a batch of already-existing (key, size) pairs in one pass.
+
+        Aggregates into local counters first, so the shared tracker state
+        takes two C-level Counter merges and a handful of integer adds
+        instead of per-file calls.
+        """
+        ext_count = Counter()
+        ext_size = Counter()
+        count = 0
+        total = 0
+        for key, size in items:
+            _, sep, ext = key.rpartition(".")
+            ext = ext.lower() if sep else "no_extension"
+            ext_count[ext] += 1
+            ext_size[ext] += size
+            count += 1
+            total += size
+        self._ext_count.update(ext_count)
+        self._ext_size.update(ext_size)
+        self.skipped_files += count
+        self.skipped_size += total
+        self.status_counts[TransferStatus.EXISTING] += count
+
+    @property
+    def extension_stats(self):
+        """Per-extension stats in {ext: {"count": ..., "size": ...}} form,
+        merged on demand from the flat counters (only read for summaries)."""
+        return {
+            ext: {"count": count, "size": self._ext_size[ext]}
+            for ext, count in self._ext_count.items()
+        }
 
     def get_progress_stats(self):
+        # Hold the lock only long enough to snapshot the counters; the
+        # humanize formatting below is pure and runs on the copied values
         with self._lock:
-            elapsed = time.time() - self.start_time
-            remaining_size = self.total_size - self.processed_size - self.skipped_size
-            eta_seconds = (
-                remaining_size / self.current_speed if self.current_speed > 0 else 0
-            )
-
-            return {
-                "processed": self.processed_files,
-                "total": self.total_files,
-                "processed_size": humanize.naturalsize(self.processed_size),
-                "total_size": humanize.naturalsize(self.total_size),
-                "speed": humanize.naturalsize(self.current_speed) + "/s",
-                "elapsed": humanize.naturaldelta(elapsed),
-                "eta": (
-                    humanize.naturaldelta(eta_seconds)
-                    if eta_seconds > 0
-                    else "calculating..."
-                ),
-                "percent": (
-                    ((self.processed_size + self.skipped_size) / self.total_size * 100)
-                    if self.total_size > 0
-                    else 0
-                ),
-                "skipped": self.skipped_files,
-                "skipped_size": humanize.naturalsize(self.skipped_size),
-            }
+            processed_files = self.processed_files
+            processed_size = self.processed_size
+            total_files = self.total_files
+            total_size = self.total_size
+            current_speed = self.current_speed
+            skipped_files = self.skipped_files
+            skipped_size = self.skipped_size
+            start_time = self.start_time
+
+        elapsed = time.time() - start_time
+        remaining_size = total_size - processed_size - skipped_size
+        eta_seconds = remaining_size / current_speed if current_speed > 0 else 0
+
+        return {
+            "processed": processed_files,
+            "total": total_files,
+            "processed_size": humanize.naturalsize(processed_size),
+            "total_size": humanize.naturalsize(total_size),
+            "speed": humanize.naturalsize(current_speed) + "/s",
+            "elapsed": humanize.naturaldelta(elapsed),
+            "eta": (
+                humanize.naturaldelta(eta_seconds)
+                if eta_seconds > 0
+                else "calculating..."
+            ),
+            "percent": (
+                ((processed_size + skipped_size) / total_size * 100)
+                if total_size > 0
+                else 0
+            ),
+            "skipped": skipped_files,
+            "skipped_size": humanize.naturalsize(skipped_size),
+        }
 
 
 def parse_s3_url(s3_url):
@@ -113,14 +217,17 @@ def parse_s3_url(s3_url):
     Parse an S3 URL in the format s3://bucket-name/prefix/
     Returns tuple of (bucket_name, prefix)
     """
-    match = re.match(r"s3://([^/]+)/?(.*)$", s3_url)
-    if not match:
+    # The format is simple enough for C-level string ops; no regex engine
+    if not s3_url.startswith("s3://"):
         raise ValueError(
             f"Invalid S3 URL format: {s3_url}. Expected format: s3://bucket-name/prefix/"
         )
 
-    bucket = match.group(1)
-    prefix = match.group(2)
+    bucket, _, prefix = s3_url[5:].partition("/")
+    if not bucket:
+        raise ValueError(
+            f"Invalid S3 URL format: {s3_url}. Expected format: s3://bucket-name/prefix/"
+        )
 
     # Ensure prefix ends with '/' if it's not empty
     if prefix and not prefix.endswith("/"):
@@ -130,68 +237,296 @@ def parse_s3_url(s3_url):
 
 
 def create_s3_client(profile_name=None, region="us-east-1"):
-    """Create an S3 client with the specified profile and region."""
+    """Create an S3 client with the specified profile and region.
+
+    The pool is sized above the default 10 connections so parallel
+    transfer workers and multipart part uploads don't block waiting for a
+    reusable HTTPS connection; adaptive retries and TCP keepalive suit
+    long-running listing/transfer sessions.
+    """
+    import boto3
+    from botocore.config import Config
+
     session = boto3.Session(profile_name=profile_name)
-    return session.client("s3", region_name=region)
+    config = Config(
+        max_pool_connections=64,
+        retries={"max_attempts": 10, "mode": "adaptive"},
+        tcp_keepalive=True,
+    )
+    return session.client("s3", region_name=region, config=config)
+
+
+def _client_for_thread(local, profile_name):
+    """Return the calling thread's S3 client, creating it on first use.
+
+    boto3 clients are thread-safe but sessions are not, so each worker
+    thread gets its own session-backed client.
+    """
+    client = getattr(local, "client", None)
+    if client is None:
+        client = create_s3_client(profile_name=profile_name)
+        local.client = client
+    return client
 
 
 def get_relative_path(key, prefix):
     """Extract the relative path of a file, ignoring the prefix structure"""
+    # removeprefix checks and slices in one C call. Non-empty prefixes
+    # always end in "/" (parse_s3_url guarantees it), so the stripped
+    # remainder cannot start with "/" and needs no lstrip scan.
     if prefix:
-        # Remove the prefix if it exists
-        if key.startswith(prefix):
-            key = key[len(prefix) :]
+        return key.removeprefix(prefix)
     return key.lstrip("/")
 
 
-def get_object_info(client, bucket, prefix):
-    """Get information about objects in the bucket/prefix"""
-    objects = {}
+def _pack_etag(etag):
+    """Pack a single-part MD5-hex ETag into its 16 raw bytes.
+
+    Cuts per-key ETag storage roughly in half on big listings. Multipart
+    ETags ("<md5>-<n>") are not pure hex and stay as strings; comparisons
+    still work because source and destination both go through this helper.
+    """
+    if len(etag) == 32 and "-" not in etag:
+        try:
+            return bytes.fromhex(etag)
+        except ValueError:
+            pass
+    return etag
+
+
+def _list_prefix(client, bucket, prefix, base_prefix, delimiter=None):
+    """List objects under a prefix, keyed by path relative to base_prefix.
+
+    Passing delimiter="/" restricts the listing to keys directly under the
+    prefix (no recursion into sub-prefixes).
+    """
     paginator = client.get_paginator("list_objects_v2")
 
-    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+    paginate_kwargs = {"Bucket": bucket, "Prefix": prefix}
+    if delimiter:
+        paginate_kwargs["Delimiter"] = delimiter
+
+    # Accumulate pairs first: building the dict once from a list of known
+    # length avoids the repeated rehash/resize a growing dict pays on
+    # million-key listings
+    pairs = []
+    for page in paginator.paginate(**paginate_kwargs):
         if "Contents" in page:
             for obj in page["Contents"]:
                 key = obj["Key"]
-                rel_path = get_relative_path(key, prefix)
-                objects[rel_path] = {
-                    "full_key": key,
-                    "size": obj["Size"],
-                    "etag": obj["ETag"].strip('"'),
-                    "last_modified": obj["LastModified"],
-                }
+                rel_path = get_relative_path(key, base_prefix)
+                pairs.append(
+                    (
+                        rel_path,
+                        ObjInfo(key, obj["Size"], _pack_etag(obj["ETag"].strip('"'))),
+                    )
+                )
+
+    return dict(pairs)
+
+
+def _listing_cache_path(bucket, prefix):
+    """Cache file for one (bucket, prefix) listing under ~/.cache/s3hop"""
+    digest = hashlib.sha1(f"{bucket}|{prefix}".encode("utf-8")).hexdigest()
+    return os.path.join(os.path.expanduser("~/.cache/s3hop"), digest + ".listing")
+
+
+def _load_cached_listing(bucket, prefix):
+    """Return a cached listing if one exists and is fresh, else None"""
+    path = _listing_cache_path(bucket, prefix)
+    try:
+        if time.time() - os.path.getmtime(path) > _LISTING_CACHE_TTL_SECONDS:
+            return None
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError):
+        return None
+
+
+def _store_cached_listing(bucket, prefix, objects):
+    """Persist a listing for reuse by a near-term rerun; best-effort"""
+    path = _listing_cache_path(bucket, prefix)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(objects, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def _invalidate_cached_listing(bucket, prefix):
+    """Drop the cached listing for bucket/prefix; best-effort"""
+    # Match get_object_info's prefix normalization so the same cache file
+    # is addressed
+    if prefix and not prefix.endswith("/"):
+        prefix += "/"
+    try:
+        os.remove(_listing_cache_path(bucket, prefix))
+    except OSError:
+        pass
+
+
+def get_object_info(client, bucket, prefix, shards=16):
+    """Get information about objects in the bucket/prefix.
+
+    Listing is latency-bound, so when the prefix contains multiple common
+    sub-prefixes the pagination is fanned out across a thread pool (one
+    pager per sub-prefix, plus one for the keys directly under the prefix)
+    and the results merged. boto3 clients are thread-safe, so the single
+    client is shared across workers. shards caps the pool size; shards=1
+    skips the discovery round-trip and pages serially.
+    """
+    # Listing against a prefix missing its trailing "/" is drastically
+    # slower on real S3; normalize before any API call
+    if prefix and not prefix.endswith("/"):
+        prefix += "/"
+
+    use_cache = os.environ.get("S3HOP_CACHE") == "1"
+    if use_cache:
+        cached = _load_cached_listing(bucket, prefix)
+        if cached is not None:
+            return cached
+
+    if shards <= 1:
+        objects = _list_prefix(client, bucket, prefix, prefix)
+    else:
+        # The discovery response is paginated like any other listing: S3
+        # caps each page at ~1000 entries (keys and CommonPrefixes combined),
+        # so stopping after one call would silently drop every object under
+        # the undiscovered sub-prefixes
+        common_prefixes = []
+        discovery_kwargs = {"Bucket": bucket, "Prefix": prefix, "Delimiter": "/"}
+        while True:
+            discovery = client.list_objects_v2(**discovery_kwargs)
+            common_prefixes.extend(
+                p["Prefix"] for p in discovery.get("CommonPrefixes", [])
+            )
+            if not discovery.get("IsTruncated"):
+                break
+            discovery_kwargs["ContinuationToken"] = discovery["NextContinuationToken"]
+
+        if len(common_prefixes) <= 1:
+            # Nothing to fan out over; walk the pages serially
+            objects = _list_prefix(client, bucket, prefix, prefix)
+        else:
+            objects = {}
+            with ThreadPoolExecutor(max_workers=shards) as executor:
+                futures = [
+                    executor.submit(_list_prefix, client, bucket, sub_prefix, prefix)
+                    for sub_prefix in common_prefixes
+                ]
+                # Keys directly under the prefix are not covered by any
+                # sub-prefix
+                futures.append(
+                    executor.submit(_list_prefix, client, bucket, prefix, prefix, "/")
+                )
+                for future in as_completed(futures):
+                    objects.update(future.result())
+
+    if use_cache:
+        _store_cached_listing(bucket, prefix, objects)
 
     return objects
 
 
-def analyze_transfer_needs(source_objects, dest_objects):
+def iter_object_info(client, bucket, prefix):
+    """Stream (rel_path, ObjInfo) pairs for objects under bucket/prefix.
+
+    Only one listing page (~1000 keys) is held at a time, and pairs are
+    yielded in S3's lexicographic key order, which merge_transfer_needs
+    relies on. A background thread prefetches the next page so its HTTP
+    round-trip overlaps parsing of the current one (double buffering).
     """
-    Analyze which files need to be transferred by matching relative paths.
-    Returns files to transfer and existing files.
+    # Same prefix normalization as get_object_info: a missing trailing "/"
+    # makes the listing far slower on real S3
+    if prefix and not prefix.endswith("/"):
+        prefix += "/"
+
+    pages = queue.Queue(maxsize=2)
+    done = object()
+    stop = threading.Event()
+
+    def offer(item):
+        # Never block indefinitely on the bounded queue: if the consumer
+        # abandons the generator, stop gets set and the fetcher must exit
+        # instead of leaking a thread and its open HTTP response
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def fetch_pages():
+        try:
+            paginator = client.get_paginator("list_objects_v2")
+            for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+                if not offer(page):
+                    return
+        except Exception as exc:
+            offer(exc)
+            return
+        offer(done)
+
+    fetcher = threading.Thread(target=fetch_pages, daemon=True)
+    fetcher.start()
+
+    try:
+        while True:
+            page = pages.get()
+            if page is done:
+                break
+            if isinstance(page, Exception):
+                raise page
+            if "Contents" in page:
+                for obj in page["Contents"]:
+                    key = obj["Key"]
+                    rel_path = get_relative_path(key, prefix)
+                    yield rel_path, ObjInfo(
+                        key, obj["Size"], _pack_etag(obj["ETag"].strip('"'))
+                    )
+    finally:
+        # Runs on normal exhaustion and on close()/GC of the generator
+        stop.set()
+
+
+def merge_transfer_needs(source_iter, dest_iter):
+    """Merge-join two sorted listing streams into transfer decisions.
+
+    Both iterators must yield (rel_path, info) pairs in ascending rel_path
+    order, as iter_object_info does. Neither full catalog is materialized:
+    the destination stream is consumed page by page and discarded, so
+    memory is bounded by the source-side results instead of two complete
+    listings. Destination-only keys are ignored.
+
+    Returns the same tuple as analyze_transfer_needs.
     """
     to_transfer = {}
     existing = {}
     total_new_size = 0
     total_existing_size = 0
 
-    # Compare files based on their relative paths
-    for rel_path, source_info in source_objects.items():
-        if rel_path in dest_objects:
-            # File exists in destination (by relative path)
-            dest_info = dest_objects[rel_path]
-            if (
-                source_info["etag"] != dest_info["etag"]
-                or source_info["last_modified"] > dest_info["last_modified"]
-            ):
-                # File needs update
+    dest_iter = iter(dest_iter)
+    dest_path, dest_info = next(dest_iter, (None, None))
+
+    for rel_path, source_info in source_iter:
+        # Skip destination keys that sort before the current source key;
+        # they have no source counterpart
+        while dest_path is not None and dest_path < rel_path:
+            dest_path, dest_info = next(dest_iter, (None, None))
+
+        if dest_path == rel_path:
+            if source_info["etag"] != dest_info["etag"]:
                 to_transfer[source_info["full_key"]] = {
                     "size": source_info["size"],
                     "dest_key": dest_info["full_key"],
-                    "status": TransferStatus.UPDATED,
+                    "status": _STATUS_UPDATED,
                 }
                 total_new_size += source_info["size"]
             else:
-                # File is identical
                 existing[source_info["full_key"]] = {
                     "size": source_info["size"],
                     "dest_key": dest_info["full_key"],
@@ -202,11 +537,102 @@ def analyze_transfer_needs(source_objects, dest_objects):
             to_transfer[source_info["full_key"]] = {
                 "size": source_info["size"],
                 "dest_key": None,  # Will be calculated during transfer
-                "status": TransferStatus.NEW,
+                "status": _STATUS_NEW,
             }
             total_new_size += source_info["size"]
 
-    return to_transfer, existing, total_new_size, total_existing_size
+    # The destination stream may still hold unread pages when the source is
+    # exhausted; close it explicitly so a generator (and the prefetch thread
+    # behind iter_object_info) releases its resources now rather than at GC
+    close = getattr(dest_iter, "close", None)
+    if close is not None:
+        close()
+
+    return (
+        to_transfer,
+        existing,
+        total_new_size,
+        total_existing_size,
+        total_new_size + total_existing_size,
+    )
+
+
+def catalog_digest(objects):
+    """
+    Aggregate digest over a listing's (relative path, ETag) pairs in sorted
+    key order. Two catalogs with the same digest hold identical content;
+    callers that persist the digest between runs can detect "nothing
+    changed" without re-diffing the catalogs.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for rel_path in sorted(objects):
+        etag = objects[rel_path]["etag"]
+        h.update(rel_path.encode())
+        h.update(etag if isinstance(etag, bytes) else etag.encode())
+    return h.hexdigest()
+
+
+def analyze_transfer_needs(source_objects, dest_objects):
+    """
+    Analyze which files need to be transferred by matching relative paths.
+    Both arguments are {rel_path: info} mappings as returned by
+    get_object_info. Returns files to transfer, existing files, their sizes,
+    and the total source size (every source object lands in exactly one of
+    the two groups).
+    """
+    to_transfer = {}
+    existing = {}
+    total_new_size = 0
+    total_existing_size = 0
+
+    # Partition the relative paths up front with dict-view set ops, which
+    # run at C speed in one pass instead of a Python membership probe per key.
+    # Both arguments must be mappings: the intersection loop below needs the
+    # destination's ETags and full keys, not just its key set.
+    source_keys = source_objects.keys()
+    dest_keys = dest_objects.keys()
+
+    for rel_path in source_keys - dest_keys:
+        # New file
+        source_info = source_objects[rel_path]
+        to_transfer[source_info["full_key"]] = {
+            "size": source_info["size"],
+            "dest_key": None,  # Will be calculated during transfer
+            "status": _STATUS_NEW,
+        }
+        total_new_size += source_info["size"]
+
+    for rel_path in source_keys & dest_keys:
+        # File exists in destination (by relative path). Compare ETags
+        # only: S3 bumps LastModified when an identical object is re-PUT,
+        # so a timestamp check re-transfers unchanged files. Single-part
+        # ETags are content MD5s; multipart ETags ("<md5>-<n>") still
+        # compare equal across identical uploads with the same chunk size.
+        source_info = source_objects[rel_path]
+        dest_info = dest_objects[rel_path]
+        if source_info["etag"] != dest_info["etag"]:
+            # File needs update
+            to_transfer[source_info["full_key"]] = {
+                "size": source_info["size"],
+                "dest_key": dest_info["full_key"],
+                "status": _STATUS_UPDATED,
+            }
+            total_new_size += source_info["size"]
+        else:
+            # File is identical
+            existing[source_info["full_key"]] = {
+                "size": source_info["size"],
+                "dest_key": dest_info["full_key"],
+            }
+            total_existing_size += source_info["size"]
+
+    return (
+        to_transfer,
+        existing,
+        total_new_size,
+        total_existing_size,
+        total_new_size + total_existing_size,
+    )
 
 
 def print_summary(tracker):
@@ -241,10 +667,11 @@ def print_summary(tracker):
             print(f"  ... and {len(tracker.failed_files) - 10} more")
 
     print("\nFile type statistics:")
-    sorted_stats = sorted(
-        tracker.extension_stats.items(), key=lambda x: x[1]["size"], reverse=True
+    # Only the top 10 are shown, so an O(N) heap selection beats a full sort
+    top_stats = heapq.nlargest(
+        10, tracker.extension_stats.items(), key=lambda x: x[1]["size"]
     )
-    for ext, stats in sorted_stats[:10]:
+    for ext, stats in top_stats:
         print(
             f"  .{ext}: {stats['count']} files, {humanize.naturalsize(stats['size'])}"
         )
@@ -254,16 +681,15 @@ def upload_with_progress(
     client, source_response, dest_bucket, dest_key, size, progress_callback
 ):
     """Upload a file to S3 with progress tracking"""
+    import boto3.s3.transfer
+    from botocore.exceptions import ClientError
+
     # AWS limits the number of parts per upload to 10,000
     MAX_PARTS = 10000
-    # We need to calculate the part sizes based on the file size
-    # and the maximum number of parts allowed by S3.
-    # We can use the following formula to calculate the part size:
-    # part_size = file_size / MAX_PARTS -- If size is not higher then 1GB then just use 10MB for the chunk size
-    part_size = 1024 * 1024 * 10
-
-    if size > 1024 * 1024 * 1000:
-        part_size = (size // MAX_PARTS) + 1
+    # Part size must be large enough to fit the file in 10,000 parts, but
+    # never smaller than 10MB: tiny parts waste round-trips, and the old
+    # size-based branch picked ~100KB parts for files just over 1GB.
+    part_size = max((size // MAX_PARTS) + 1, 1024 * 1024 * 10)
 
     config = boto3.s3.transfer.TransferConfig(
         multipart_threshold=1024 * 1024 * 10,  # 10MB
@@ -287,7 +713,81 @@ def upload_with_progress(
         raise e
 
 
-def copy_bucket(source_profile, source_url, dest_profile, dest_url):
+def copy_server_side(
+    dest_client, source_bucket, source_key, dest_bucket, dest_key, size
+):
+    """Copy an object entirely within S3, without streaming it through this machine.
+
+    Requires bucket policies that let the destination account read the source
+    bucket. Objects of 5GiB or more exceed the CopyObject limit and are copied
+    as parallel UploadPartCopy parts instead.
+    """
+    # CopyObject supports sources up to 5GiB
+    MAX_COPY_SIZE = 5 * 1024 * 1024 * 1024
+    # AWS limits the number of parts per upload to 10,000
+    MAX_PARTS = 10000
+
+    copy_source = {"Bucket": source_bucket, "Key": source_key}
+
+    if size < MAX_COPY_SIZE:
+        dest_client.copy_object(
+            Bucket=dest_bucket, Key=dest_key, CopySource=copy_source
+        )
+        return
+
+    part_size = max((size // MAX_PARTS) + 1, 1024 * 1024 * 64)
+
+    upload = dest_client.create_multipart_upload(Bucket=dest_bucket, Key=dest_key)
+    upload_id = upload["UploadId"]
+
+    def copy_part(part_number, start, end):
+        response = dest_client.upload_part_copy(
+            Bucket=dest_bucket,
+            Key=dest_key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            CopySource=copy_source,
+            CopySourceRange=f"bytes={start}-{end}",
+        )
+        return {"PartNumber": part_number, "ETag": response["CopyPartResult"]["ETag"]}
+
+    try:
+        parts = []
+        with ThreadPoolExecutor(max_workers=15) as executor:
+            futures = [
+                executor.submit(
+                    copy_part,
+                    part_number,
+                    start,
+                    min(start + part_size, size) - 1,
+                )
+                for part_number, start in enumerate(range(0, size, part_size), start=1)
+            ]
+            for future in as_completed(futures):
+                parts.append(future.result())
+
+        parts.sort(key=lambda part: part["PartNumber"])
+        dest_client.complete_multipart_upload(
+            Bucket=dest_bucket,
+            Key=dest_key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": parts},
+        )
+    except Exception:
+        dest_client.abort_multipart_upload(
+            Bucket=dest_bucket, Key=dest_key, UploadId=upload_id
+        )
+        raise
+
+
+def copy_bucket(
+    source_profile,
+    source_url,
+    dest_profile,
+    dest_url,
+    concurrency=16,
+    copy_mode="stream",
+):
     """
     Copy all objects from source bucket to destination bucket using streaming.
 
@@ -296,7 +796,12 @@ def copy_bucket(source_profile, source_url, dest_profile, dest_url):
         source_url (str): Source S3 URL (s3://bucket-name/prefix/)
         dest_profile (str): AWS profile for destination account
         dest_url (str): Destination S3 URL (s3://bucket-name/prefix/)
+        concurrency (int): Number of objects to transfer in parallel
+        copy_mode (str): "stream" to route bytes through this machine, or
+            "server_side" to copy within S3 (needs cross-account bucket policies)
     """
+    from botocore.exceptions import ClientError
+
     # If version contains -dev, print the version
     if "-" in __version__:
         print(f"s3hop version: {__version__}")
@@ -314,18 +819,30 @@ def copy_bucket(source_profile, source_url, dest_profile, dest_url):
     # Initialize progress tracker
     tracker = ProgressTracker()
 
-    # Get list of objects from both buckets with relative paths
+    # Stream both listings through a merge-join instead of materializing
+    # two full catalogs; keeps memory bounded on multi-million-key buckets.
+    # With S3HOP_CACHE=1 the catalogs are materialized via get_object_info
+    # instead, so near-term reruns skip the re-listing entirely — the disk
+    # cache has to hold a full listing either way.
     print("Analyzing source and destination buckets...")
-    source_objects = get_object_info(source_client, source_bucket, source_prefix)
-    dest_objects = get_object_info(dest_client, dest_bucket, dest_prefix)
-
-    # Analyze what needs to be transferred
-    to_transfer, existing, total_new_size, total_existing_size = analyze_transfer_needs(
-        source_objects, dest_objects
-    )
+    if os.environ.get("S3HOP_CACHE") == "1":
+        to_transfer, existing, total_new_size, total_existing_size, total_size = (
+            analyze_transfer_needs(
+                get_object_info(source_client, source_bucket, source_prefix),
+                get_object_info(dest_client, dest_bucket, dest_prefix),
+            )
+        )
+    else:
+        to_transfer, existing, total_new_size, total_existing_size, total_size = (
+            merge_transfer_needs(
+                iter_object_info(source_client, source_bucket, source_prefix),
+                iter_object_info(dest_client, dest_bucket, dest_prefix),
+            )
+        )
+    total_source_files = len(to_transfer) + len(existing)
 
     print("\n=== Pre-transfer Analysis ===")
-    print(f"Total files in source: {len(source_objects)}")
+    print(f"Total files in source: {total_source_files}")
     print(
         f"Files already in destination: {len(existing)} ({humanize.naturalsize(total_existing_size)})"
     )
@@ -337,78 +854,161 @@ def copy_bucket(source_profile, source_url, dest_profile, dest_url):
         print("\nAll files are already up to date in the destination bucket.")
         return
 
-    # Update tracker with totals
-    tracker.add_total(
-        len(source_objects), sum(obj["size"] for obj in source_objects.values())
-    )
+    # The destination listing cached during analysis goes stale as soon as
+    # transfers start; drop it so a rerun within the TTL re-lists instead
+    # of re-queueing everything this run already copied
+    if os.environ.get("S3HOP_CACHE") == "1":
+        _invalidate_cached_listing(dest_bucket, dest_prefix)
 
-    # Mark existing files as skipped
-    for source_key, info in existing.items():
-        tracker.add_skipped(info["size"])
-        tracker.update_status_count(TransferStatus.EXISTING)
-        tracker.update_extension_stats(source_key, info["size"])
+    # Update tracker with totals (total_size already accumulated during the
+    # analysis pass, so no second scan over the source listing)
+    tracker.add_total(total_source_files, total_size)
+
+    # Mark existing files as skipped in one bulk pass over the catalog
+    tracker.add_skipped_bulk(
+        (source_key, info["size"]) for source_key, info in existing.items()
+    )
 
     # Create progress bar for remaining transfers
     progress_bar = tqdm(
-        total=total_new_size, unit="B", unit_scale=True, desc="Transferring", ncols=100
+        total=total_new_size,
+        unit="B",
+        unit_scale=True,
+        desc="Transferring",
+        ncols=100,
+        mininterval=0.25,
+        miniters=1,
     )
 
-    # Create status update thread
-    def update_status():
-        while True:
-            time.sleep(1)
-            stats = tracker.get_progress_stats()
-            progress_bar.set_postfix(
-                files=f"{stats['processed'] + stats['skipped']}/{stats['total']}",
-                speed=stats["speed"],
-                eta=stats["eta"],
+    # Refresh the postfix from the completion loop at most once a second;
+    # a dedicated polling thread would recompute the stats even when idle
+    last_postfix_time = time.monotonic()
+
+    def maybe_update_postfix():
+        nonlocal last_postfix_time
+        now = time.monotonic()
+        if now - last_postfix_time < 1.0:
+            return
+        last_postfix_time = now
+        stats = tracker.get_progress_stats()
+        progress_bar.set_postfix(
+            files=f"{stats['processed'] + stats['skipped']}/{stats['total']}",
+            speed=stats["speed"],
+            eta=stats["eta"],
+        )
+
+    # Per-thread clients for the worker pool (sessions are not thread-safe)
+    source_local = threading.local()
+    dest_local = threading.local()
+
+    def transfer_one(source_key, info):
+        size = info["size"]
+
+        # Calculate destination key
+        if info["dest_key"]:
+            # Use existing destination key for updates
+            dest_key = info["dest_key"]
+        else:
+            # Calculate new destination key for new files. S3 keys always use
+            # "/" and parse_s3_url guarantees a trailing "/" on non-empty
+            # prefixes, so plain concatenation is correct (os.path.join would
+            # inject backslashes on Windows).
+            rel_path = get_relative_path(source_key, source_prefix)
+            dest_key = dest_prefix + rel_path
+
+        worker_dest_client = _client_for_thread(dest_local, dest_profile)
+
+        if copy_mode == "server_side":
+            copy_server_side(
+                worker_dest_client,
+                source_bucket,
+                source_key,
+                dest_bucket,
+                dest_key,
+                size,
             )
+            # No byte-level callback for server-side copies; count the
+            # object once the copy returns
+            progress_bar.update(size)
+            return size
 
-    status_thread = threading.Thread(target=update_status, daemon=True)
-    status_thread.start()
+        worker_source_client = _client_for_thread(source_local, source_profile)
 
-    try:
-        # Process files that need to be transferred
-        for source_key, info in to_transfer.items():
-            size = info["size"]
-
-            # Calculate destination key
-            if info["dest_key"]:
-                # Use existing destination key for updates
-                dest_key = info["dest_key"]
-            else:
-                # Calculate new destination key for new files
-                rel_path = get_relative_path(source_key, source_prefix)
-                dest_key = (
-                    os.path.join(dest_prefix, rel_path) if dest_prefix else rel_path
-                )
+        source_response = worker_source_client.get_object(
+            Bucket=source_bucket, Key=source_key
+        )
 
-            try:
-                source_response = source_client.get_object(
-                    Bucket=source_bucket, Key=source_key
-                )
+        # boto3 fires the callback from its transfer threads on every part
+        # read, so batch bytes per thread and only touch tqdm when a batch
+        # is big or old enough
+        flushed = {"bytes": 0}
+        flush_lock = threading.Lock()
+        batch = threading.local()
+
+        def upload_progress_callback(bytes_transferred):
+            now = time.monotonic()
+            pending = getattr(batch, "pending", 0) + bytes_transferred
+            last_flush = getattr(batch, "last_flush", now)
+            if (
+                pending >= _PROGRESS_FLUSH_BYTES
+                or now - last_flush > _PROGRESS_FLUSH_SECONDS
+            ):
+                progress_bar.update(pending)
+                with flush_lock:
+                    flushed["bytes"] += pending
+                batch.pending = 0
+                batch.last_flush = now
+            else:
+                batch.pending = pending
+                batch.last_flush = last_flush
 
-                def upload_progress_callback(bytes_transferred):
-                    progress_bar.update(bytes_transferred)
+        upload_with_progress(
+            worker_dest_client,
+            source_response,
+            dest_bucket,
+            dest_key,
+            size,
+            upload_progress_callback,
+        )
 
-                upload_with_progress(
-                    dest_client,
-                    source_response,
-                    dest_bucket,
-                    dest_key,
-                    size,
-                    upload_progress_callback,
-                )
+        # Credit whatever the transfer threads still had batched locally
+        remainder = size - flushed["bytes"]
+        if remainder > 0:
+            progress_bar.update(remainder)
+        return size
 
-                # Update progress
-                tracker.update(size)
-                tracker.update_extension_stats(source_key, size)
-                tracker.update_status_count(info["status"])
-                progress_bar.update(size)
+    try:
+        # Process files that need to be transferred in parallel. Each future
+        # is handled individually so one failure does not cancel its siblings.
+        # The executor is shut down explicitly rather than via a with block:
+        # on Ctrl+C the context manager's shutdown(wait=True) would first run
+        # the entire queued backlog, so cancel pending futures before
+        # re-raising and only wait when the loop completed normally.
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            futures = {
+                executor.submit(transfer_one, source_key, info): (source_key, info)
+                for source_key, info in to_transfer.items()
+            }
 
-            except ClientError as e:
-                print(f"\nError copying {source_key}: {str(e)}", file=sys.stderr)
-                tracker.add_failed(source_key)
+            for future in as_completed(futures):
+                source_key, info = futures[future]
+                try:
+                    size = future.result()
+                except ClientError as e:
+                    print(f"\nError copying {source_key}: {str(e)}", file=sys.stderr)
+                    tracker.add_failed(source_key)
+                else:
+                    # Update progress (bytes are counted by the upload callback)
+                    tracker.update(size)
+                    tracker.update_extension_stats(source_key, size)
+                    tracker.update_status_count(info["status"])
+
+                maybe_update_postfix()
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
 
         progress_bar.close()
         print_summary(tracker)
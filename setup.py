@@ -21,15 +21,12 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.6",
-        "Programming Language :: Python :: 3.7",
-        "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Programming Language :: Python :: 3.12",
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.9",
     install_requires=[
         "boto3>=1.26.0",
         "botocore>=1.29.0",
@@ -40,6 +37,7 @@ setup(
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
+            "moto[server]>=4.0.0",
             "black>=22.0.0",
             "isort>=5.0.0",
             "flake8>=4.0.0",
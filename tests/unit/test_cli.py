@@ -24,6 +24,32 @@ def test_main_successful():
                 "s3://source-bucket/prefix/",
                 "dest-profile",
                 "s3://dest-bucket/prefix/",
+                concurrency=16,
+                copy_mode="stream",
+            )
+
+
+def test_main_server_side():
+    """Test CLI with --server-side flag"""
+    test_args = [
+        "script_name",
+        "source-profile",
+        "s3://source-bucket/prefix/",
+        "dest-profile",
+        "s3://dest-bucket/prefix/",
+        "--server-side",
+    ]
+
+    with patch.object(sys, "argv", test_args):
+        with patch("s3hop.core.copy_bucket") as mock_copy:
+            cli.main()
+            mock_copy.assert_called_once_with(
+                "source-profile",
+                "s3://source-bucket/prefix/",
+                "dest-profile",
+                "s3://dest-bucket/prefix/",
+                concurrency=16,
+                copy_mode="server_side",
             )
 
 
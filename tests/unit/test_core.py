@@ -1,6 +1,8 @@
+import threading
+import time
 from datetime import datetime
 from io import BytesIO
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 
 import boto3
 import pytest
@@ -11,8 +13,11 @@ from s3hop.core import (
     ProgressTracker,
     TransferStatus,
     analyze_transfer_needs,
+    catalog_digest,
     get_object_info,
     get_relative_path,
+    iter_object_info,
+    merge_transfer_needs,
     parse_s3_url,
     upload_with_progress,
 )
@@ -92,6 +97,25 @@ def test_progress_tracker_extension_stats():
     assert tracker.extension_stats["jpg"]["size"] == 3000
 
 
+def test_progress_tracker_add_skipped_bulk():
+    """Test bulk-recording existing files on the ProgressTracker"""
+    tracker = ProgressTracker()
+    tracker.add_skipped_bulk(
+        [
+            ("a.txt", 1000),
+            ("b.txt", 2000),
+            ("image.jpg", 3000),
+        ]
+    )
+
+    assert tracker.skipped_files == 3
+    assert tracker.skipped_size == 6000
+    assert tracker.status_counts[TransferStatus.EXISTING] == 3
+    assert tracker.extension_stats["txt"]["count"] == 2
+    assert tracker.extension_stats["txt"]["size"] == 3000
+    assert tracker.extension_stats["jpg"]["count"] == 1
+
+
 # Path Handling Tests
 def test_get_relative_path_with_prefix():
     """Test getting relative path with prefix"""
@@ -127,7 +151,7 @@ def test_analyze_transfer_needs_new_file():
     }
     dest_objects = {}
 
-    to_transfer, existing, new_size, existing_size = analyze_transfer_needs(
+    to_transfer, existing, new_size, existing_size, total_size = analyze_transfer_needs(
         source_objects, dest_objects
     )
 
@@ -159,7 +183,7 @@ def test_analyze_transfer_needs_existing_file():
         }
     }
 
-    to_transfer, existing, new_size, existing_size = analyze_transfer_needs(
+    to_transfer, existing, new_size, existing_size, total_size = analyze_transfer_needs(
         source_objects, dest_objects
     )
 
@@ -191,7 +215,7 @@ def test_analyze_transfer_needs_updated_file():
         }
     }
 
-    to_transfer, existing, new_size, existing_size = analyze_transfer_needs(
+    to_transfer, existing, new_size, existing_size, total_size = analyze_transfer_needs(
         source_objects, dest_objects
     )
 
@@ -202,6 +226,147 @@ def test_analyze_transfer_needs_updated_file():
     assert to_transfer["file.txt"]["status"] == TransferStatus.UPDATED
 
 
+def test_catalog_digest_identical_catalogs():
+    """Test that identical catalogs share a digest and diff to no transfers"""
+    source_objects = {
+        "a.txt": {"full_key": "src/a.txt", "size": 100, "etag": "e1"},
+        "b.txt": {"full_key": "src/b.txt", "size": 200, "etag": b"\x01\x02"},
+    }
+    dest_objects = {
+        "a.txt": {"full_key": "dst/a.txt", "size": 100, "etag": "e1"},
+        "b.txt": {"full_key": "dst/b.txt", "size": 200, "etag": b"\x01\x02"},
+    }
+
+    assert catalog_digest(source_objects) == catalog_digest(dest_objects)
+
+    to_transfer, existing, new_size, existing_size, total_size = analyze_transfer_needs(
+        source_objects, dest_objects
+    )
+
+    assert to_transfer == {}
+    assert set(existing) == {"src/a.txt", "src/b.txt"}
+    assert existing["src/a.txt"]["dest_key"] == "dst/a.txt"
+    assert new_size == 0
+    assert existing_size == 300
+    assert total_size == 300
+
+
+def test_catalog_digest_detects_etag_change():
+    """Test that a single ETag change produces a different digest"""
+    objects = {"a.txt": {"full_key": "a.txt", "size": 100, "etag": "e1"}}
+    changed = {"a.txt": {"full_key": "a.txt", "size": 100, "etag": "e2"}}
+
+    assert catalog_digest(objects) != catalog_digest(changed)
+
+
+def test_merge_transfer_needs_sorted_streams():
+    """Test merge-joining sorted source and destination listing streams"""
+    source_stream = [
+        ("a.txt", {"full_key": "src/a.txt", "size": 100, "etag": "same"}),
+        ("b.txt", {"full_key": "src/b.txt", "size": 200, "etag": "changed"}),
+        ("d.txt", {"full_key": "src/d.txt", "size": 400, "etag": "new"}),
+    ]
+    dest_stream = [
+        ("a.txt", {"full_key": "dst/a.txt", "size": 100, "etag": "same"}),
+        ("b.txt", {"full_key": "dst/b.txt", "size": 200, "etag": "old"}),
+        ("c.txt", {"full_key": "dst/c.txt", "size": 300, "etag": "dest-only"}),
+    ]
+
+    to_transfer, existing, new_size, existing_size, total_size = merge_transfer_needs(
+        iter(source_stream), iter(dest_stream)
+    )
+
+    assert set(to_transfer) == {"src/b.txt", "src/d.txt"}
+    assert to_transfer["src/b.txt"]["status"] == TransferStatus.UPDATED
+    assert to_transfer["src/b.txt"]["dest_key"] == "dst/b.txt"
+    assert to_transfer["src/d.txt"]["status"] == TransferStatus.NEW
+    assert set(existing) == {"src/a.txt"}
+    assert new_size == 600
+    assert existing_size == 100
+    assert total_size == 700
+
+
+def test_merge_transfer_needs_empty_destination():
+    """Test merge-join when the destination stream is empty"""
+    source_stream = [
+        ("a.txt", {"full_key": "a.txt", "size": 100, "etag": "e1"}),
+    ]
+
+    to_transfer, existing, new_size, existing_size, total_size = merge_transfer_needs(
+        iter(source_stream), iter([])
+    )
+
+    assert len(to_transfer) == 1
+    assert len(existing) == 0
+    assert to_transfer["a.txt"]["status"] == TransferStatus.NEW
+    assert new_size == 100
+    assert total_size == 100
+
+
+def test_iter_object_info_streams_pages_in_order():
+    """Test that iter_object_info yields keys across prefetched pages in order"""
+    mock_client = Mock()
+    mock_paginator = Mock()
+    mock_client.get_paginator.return_value = mock_paginator
+    mock_paginator.paginate.return_value = iter(
+        [
+            {
+                "Contents": [
+                    {"Key": "test/a.txt", "Size": 100, "ETag": '"e1"'},
+                    {"Key": "test/b.txt", "Size": 200, "ETag": '"e2"'},
+                ]
+            },
+            {
+                "Contents": [
+                    {"Key": "test/c.txt", "Size": 300, "ETag": '"e3"'},
+                ]
+            },
+        ]
+    )
+
+    entries = list(iter_object_info(mock_client, "test-bucket", "test"))
+
+    assert [rel_path for rel_path, _ in entries] == ["a.txt", "b.txt", "c.txt"]
+    assert entries[0][1]["full_key"] == "test/a.txt"
+    mock_paginator.paginate.assert_called_once_with(
+        Bucket="test-bucket", Prefix="test/"
+    )
+
+
+def test_iter_object_info_abandoned_stops_prefetch_thread():
+    """Test that abandoning the generator terminates the prefetch thread"""
+    mock_client = Mock()
+    mock_paginator = Mock()
+    mock_client.get_paginator.return_value = mock_paginator
+    mock_paginator.paginate.return_value = iter(
+        [
+            {"Contents": [{"Key": f"test/{i:03d}.txt", "Size": 1, "ETag": '"e"'}]}
+            for i in range(50)
+        ]
+    )
+
+    baseline_threads = threading.active_count()
+    gen = iter_object_info(mock_client, "test-bucket", "test/")
+    next(gen)
+    gen.close()
+
+    deadline = time.monotonic() + 2
+    while threading.active_count() > baseline_threads and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert threading.active_count() == baseline_threads
+
+
+def test_iter_object_info_propagates_listing_errors():
+    """Test that errors from the listing thread surface to the consumer"""
+    mock_client = Mock()
+    mock_client.get_paginator.return_value.paginate.side_effect = ClientError(
+        {"Error": {"Code": "AccessDenied", "Message": "denied"}}, "ListObjectsV2"
+    )
+
+    with pytest.raises(ClientError):
+        list(iter_object_info(mock_client, "test-bucket", "test/"))
+
+
 # S3 Client Tests
 @patch("boto3.Session")
 def test_create_s3_client(mock_session):
@@ -215,9 +380,14 @@ def test_create_s3_client(mock_session):
 
     mock_session.assert_called_once_with(profile_name="test-profile")
     mock_session.return_value.client.assert_called_once_with(
-        "s3", region_name="us-east-1"
+        "s3", region_name="us-east-1", config=ANY
     )
 
+    # The pool must be large enough for the parallel transfer workers
+    config = mock_session.return_value.client.call_args.kwargs["config"]
+    assert config.max_pool_connections == 64
+    assert config.retries == {"max_attempts": 10, "mode": "adaptive"}
+
 
 @patch("boto3.Session")
 def test_get_object_info_success(mock_session):
@@ -225,6 +395,7 @@ def test_get_object_info_success(mock_session):
     mock_client = Mock()
     mock_paginator = Mock()
     mock_client.get_paginator.return_value = mock_paginator
+    mock_client.list_objects_v2.return_value = {}  # No common prefixes
 
     # Mock S3 response
     mock_paginator.paginate.return_value = [
@@ -258,6 +429,7 @@ def test_get_object_info_empty_bucket(mock_session):
     mock_client = Mock()
     mock_paginator = Mock()
     mock_client.get_paginator.return_value = mock_paginator
+    mock_client.list_objects_v2.return_value = {}  # No common prefixes
 
     # Mock empty S3 response
     mock_paginator.paginate.return_value = [{}]
@@ -271,6 +443,265 @@ def test_get_object_info_empty_bucket(mock_session):
     assert len(objects) == 0
 
 
+@patch("boto3.Session")
+def test_get_object_info_parallel_prefixes(mock_session):
+    """Test that listing fans out across common prefixes and merges results"""
+    mock_client = Mock()
+    mock_paginator = Mock()
+    mock_client.get_paginator.return_value = mock_paginator
+    mock_client.list_objects_v2.return_value = {
+        "CommonPrefixes": [{"Prefix": "test/a/"}, {"Prefix": "test/b/"}]
+    }
+
+    pages_by_prefix = {
+        "test/a/": [
+            {
+                "Contents": [
+                    {
+                        "Key": "test/a/one.txt",
+                        "Size": 1,
+                        "ETag": '"e1"',
+                        "LastModified": datetime.now(),
+                    }
+                ]
+            }
+        ],
+        "test/b/": [
+            {
+                "Contents": [
+                    {
+                        "Key": "test/b/two.txt",
+                        "Size": 2,
+                        "ETag": '"e2"',
+                        "LastModified": datetime.now(),
+                    }
+                ]
+            }
+        ],
+        "test/": [
+            {
+                "Contents": [
+                    {
+                        "Key": "test/top.txt",
+                        "Size": 3,
+                        "ETag": '"e3"',
+                        "LastModified": datetime.now(),
+                    }
+                ]
+            }
+        ],
+    }
+
+    def paginate(Bucket, Prefix, Delimiter=None):
+        return pages_by_prefix[Prefix]
+
+    mock_paginator.paginate.side_effect = paginate
+
+    mock_session.return_value.client.return_value = mock_client
+
+    from s3hop.core import get_object_info
+
+    objects = get_object_info(mock_client, "test-bucket", "test/")
+
+    assert set(objects) == {"a/one.txt", "b/two.txt", "top.txt"}
+    assert objects["b/two.txt"]["size"] == 2
+
+
+@patch("boto3.Session")
+def test_get_object_info_truncated_discovery(mock_session):
+    """Test that sub-prefix discovery follows continuation tokens"""
+    mock_client = Mock()
+    mock_paginator = Mock()
+    mock_client.get_paginator.return_value = mock_paginator
+    mock_client.list_objects_v2.side_effect = [
+        {
+            "CommonPrefixes": [{"Prefix": "test/a/"}],
+            "IsTruncated": True,
+            "NextContinuationToken": "token",
+        },
+        {"CommonPrefixes": [{"Prefix": "test/b/"}]},
+    ]
+
+    pages_by_prefix = {
+        "test/a/": [
+            {
+                "Contents": [
+                    {
+                        "Key": "test/a/one.txt",
+                        "Size": 1,
+                        "ETag": '"e1"',
+                        "LastModified": datetime.now(),
+                    }
+                ]
+            }
+        ],
+        "test/b/": [
+            {
+                "Contents": [
+                    {
+                        "Key": "test/b/two.txt",
+                        "Size": 2,
+                        "ETag": '"e2"',
+                        "LastModified": datetime.now(),
+                    }
+                ]
+            }
+        ],
+        "test/": [{}],
+    }
+
+    def paginate(Bucket, Prefix, Delimiter=None):
+        return pages_by_prefix[Prefix]
+
+    mock_paginator.paginate.side_effect = paginate
+
+    mock_session.return_value.client.return_value = mock_client
+
+    from s3hop.core import get_object_info
+
+    objects = get_object_info(mock_client, "test-bucket", "test/")
+
+    assert set(objects) == {"a/one.txt", "b/two.txt"}
+    assert mock_client.list_objects_v2.call_count == 2
+    assert mock_client.list_objects_v2.call_args.kwargs["ContinuationToken"] == "token"
+
+
+@patch("boto3.Session")
+def test_get_object_info_single_shard(mock_session):
+    """Test that shards=1 pages serially without a discovery call"""
+    mock_client = Mock()
+    mock_paginator = Mock()
+    mock_client.get_paginator.return_value = mock_paginator
+
+    mock_paginator.paginate.return_value = [
+        {
+            "Contents": [
+                {
+                    "Key": "test/file.txt",
+                    "Size": 1000,
+                    "ETag": '"abc123"',
+                    "LastModified": datetime.now(),
+                }
+            ]
+        }
+    ]
+
+    mock_session.return_value.client.return_value = mock_client
+
+    from s3hop.core import get_object_info
+
+    objects = get_object_info(mock_client, "test-bucket", "test/", shards=1)
+
+    assert len(objects) == 1
+    mock_client.list_objects_v2.assert_not_called()
+
+
+@patch("boto3.Session")
+def test_get_object_info_normalizes_prefix(mock_session):
+    """Test that a prefix missing its trailing slash is normalized"""
+    mock_client = Mock()
+    mock_paginator = Mock()
+    mock_client.get_paginator.return_value = mock_paginator
+    mock_client.list_objects_v2.return_value = {}  # No common prefixes
+
+    mock_paginator.paginate.return_value = [{}]
+
+    mock_session.return_value.client.return_value = mock_client
+
+    from s3hop.core import get_object_info
+
+    get_object_info(mock_client, "test-bucket", "test")
+
+    mock_paginator.paginate.assert_called_once_with(
+        Bucket="test-bucket", Prefix="test/"
+    )
+
+
+def test_get_object_info_disk_cache(tmp_path, monkeypatch):
+    """Test that S3HOP_CACHE=1 serves a fresh rerun from the disk cache"""
+    monkeypatch.setenv("S3HOP_CACHE", "1")
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    mock_client = Mock()
+    mock_paginator = Mock()
+    mock_client.get_paginator.return_value = mock_paginator
+    mock_client.list_objects_v2.return_value = {}  # No common prefixes
+
+    mock_paginator.paginate.return_value = [
+        {
+            "Contents": [
+                {
+                    "Key": "test/file.txt",
+                    "Size": 1000,
+                    "ETag": '"abc123"',
+                    "LastModified": datetime.now(),
+                }
+            ]
+        }
+    ]
+
+    from s3hop.core import get_object_info
+
+    first = get_object_info(mock_client, "test-bucket", "test/")
+
+    # Second call must not hit the paginator at all
+    broken_client = Mock()
+    broken_client.get_paginator.side_effect = AssertionError("should use cache")
+    second = get_object_info(broken_client, "test-bucket", "test/")
+
+    assert set(second) == set(first)
+    assert second["file.txt"]["size"] == 1000
+
+    # After invalidation the next call goes back to the API
+    from s3hop.core import _invalidate_cached_listing
+
+    _invalidate_cached_listing("test-bucket", "test/")
+    third = get_object_info(mock_client, "test-bucket", "test/")
+
+    assert set(third) == set(first)
+    assert mock_client.get_paginator.call_count == 2
+
+
+# Real-path Listing Tests
+@pytest.fixture
+def moto_s3_server():
+    """Local S3 server so listing exercises real HTTP + XML parsing"""
+    moto_server = pytest.importorskip("moto.server")
+    server = moto_server.ThreadedMotoServer(port=0)
+    server.start()
+    yield server
+    server.stop()
+
+
+def test_get_object_info_real_listing_path(moto_s3_server):
+    """Test listing against a real (local) S3 endpoint, not mocks"""
+    import hashlib
+
+    host, port = moto_s3_server.get_host_and_port()
+    client = boto3.client(
+        "s3",
+        endpoint_url=f"http://{host}:{port}",
+        region_name="us-east-1",
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+    )
+
+    client.create_bucket(Bucket="test-bucket")
+    for i in range(3):
+        client.put_object(
+            Bucket="test-bucket", Key=f"data/file{i}.txt", Body=b"x" * (i + 1)
+        )
+    client.put_object(Bucket="test-bucket", Key="other/ignored.txt", Body=b"y")
+
+    objects = get_object_info(client, "test-bucket", "data/")
+
+    assert set(objects) == {"file0.txt", "file1.txt", "file2.txt"}
+    assert objects["file1.txt"]["size"] == 2
+    # The real ETag flows through botocore's XML parser and gets packed to
+    # raw MD5 bytes on the way in
+    assert objects["file1.txt"]["etag"] == hashlib.md5(b"xx").digest()
+
+
 # Upload Progress Tests
 @patch("boto3.s3.transfer.TransferConfig")
 def test_upload_with_progress_success(mock_transfer_config):
@@ -391,3 +822,50 @@ def test_upload_with_progress_callback(mock_transfer_config):
     # Verify callback was called twice with correct values
     assert mock_callback.call_count == 2
     mock_callback.assert_any_call(512)
+
+
+# Server-side Copy Tests
+def test_copy_server_side_small_object():
+    """Test server-side copy of an object under the CopyObject limit"""
+    from s3hop.core import copy_server_side
+
+    mock_client = Mock()
+
+    copy_server_side(
+        mock_client, "src-bucket", "src/key.txt", "dst-bucket", "dst/key.txt", 1024
+    )
+
+    mock_client.copy_object.assert_called_once_with(
+        Bucket="dst-bucket",
+        Key="dst/key.txt",
+        CopySource={"Bucket": "src-bucket", "Key": "src/key.txt"},
+    )
+    mock_client.create_multipart_upload.assert_not_called()
+
+
+def test_copy_server_side_large_object():
+    """Test server-side copy of an object over the CopyObject limit"""
+    from s3hop.core import copy_server_side
+
+    mock_client = Mock()
+    mock_client.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+    mock_client.upload_part_copy.return_value = {"CopyPartResult": {"ETag": '"e1"'}}
+
+    size = 6 * 1024 * 1024 * 1024  # 6GB, above the 5GiB CopyObject limit
+
+    copy_server_side(
+        mock_client, "src-bucket", "src/big.bin", "dst-bucket", "dst/big.bin", size
+    )
+
+    mock_client.copy_object.assert_not_called()
+    mock_client.create_multipart_upload.assert_called_once_with(
+        Bucket="dst-bucket", Key="dst/big.bin"
+    )
+    assert mock_client.upload_part_copy.call_count > 1
+    mock_client.complete_multipart_upload.assert_called_once()
+
+    # Parts must be numbered contiguously from 1 in the completion request
+    parts = mock_client.complete_multipart_upload.call_args.kwargs["MultipartUpload"][
+        "Parts"
+    ]
+    assert [part["PartNumber"] for part in parts] == list(range(1, len(parts) + 1))